@@ -1,7 +1,14 @@
-import json
-from collections import defaultdict, OrderedDict
+import orjson
+import os
+from contextlib import ExitStack
 from pathlib import Path
+from typing import BinaryIO
 from wikadata.utils.logger import logger
+from wikadata.utils.json_stream import (
+    write_json_start,
+    write_json_entry,
+    write_json_end,
+)
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -12,83 +19,106 @@ PARSED_DIRS = SCRIPT_DIR.glob("*/parsed/*.json")
 def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    merged_dictionaries = collect_dictionaries()
+    merged_dictionaries = collect_dictionaries(OUTPUT_DIR)
 
-    for filename, data in merged_dictionaries.items():
-        filepath = OUTPUT_DIR / filename
-        with filepath.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved merged dictionary: {filename}")
+    for filename, total_entries in merged_dictionaries.items():
+        logger.info(f"Saved merged dictionary: {filename} ({total_entries} entries)")
 
     logger.info("Dictionaries generated successfully.")
 
 
-def collect_dictionaries() -> dict[str, OrderedDict]:
-    """Aggregate dictionary data from all parsed sources."""
-    merged_data = defaultdict(lambda: {"meta": OrderedDict(), "entries": []})
-
-    for file in PARSED_DIRS:
-        with file.open(encoding="utf-8") as f:
-            data = json.load(f, object_pairs_hook=OrderedDict)
-            meta = data["meta"]
-            entries = data["entries"]
-
-        filename = f"dictionary_{meta['lang']}_{meta['definition_lang']}.json"
-
-        merged_data[filename]["meta"] = OrderedDict(
-            [
-                ("lang", meta["lang"]),
-                ("definition_lang", meta["definition_lang"]),
-            ]
-        )
-        merged_data[filename]["entries"].extend(
-            ensure_ordered_entry(entry, meta) for entry in entries
-        )
-
-        logger.info(f"Merged {file} into {filename}")
-
-    return merged_data
-
-
-def ensure_ordered_entry(entry: dict, meta: OrderedDict) -> OrderedDict:
+def collect_dictionaries(output_dir: Path) -> dict[str, int]:
+    """Aggregate dictionary data from all parsed sources.
+
+    Entries are streamed into temporary files as each source is read, so only one
+    source is held in memory at a time. The merged files are only replaced once
+    every source has been written. Returns the entry count of each file.
+    """
+    outputs: dict[str, BinaryIO] = {}
+    temp_paths: dict[str, Path] = {}
+    total_entries: dict[str, int] = {}
+
+    try:
+        with ExitStack() as stack:
+            for file in PARSED_DIRS:
+                data = orjson.loads(file.read_bytes())
+                meta = data["meta"]
+
+                filename = f"dictionary_{meta['lang']}_{meta['definition_lang']}.json"
+
+                if filename not in outputs:
+                    temp_paths[filename] = output_dir / f"{filename}.tmp"
+                    outputs[filename] = stack.enter_context(
+                        temp_paths[filename].open("wb")
+                    )
+                    write_json_start(
+                        outputs[filename],
+                        {
+                            "lang": meta["lang"],
+                            "definition_lang": meta["definition_lang"],
+                        },
+                    )
+                    total_entries[filename] = 0
+
+                for entry in data["entries"]:
+                    write_json_entry(
+                        outputs[filename],
+                        ensure_ordered_entry(entry, meta),
+                        first=total_entries[filename] == 0,
+                    )
+                    total_entries[filename] += 1
+
+                logger.info(f"Merged {file} into {filename}")
+
+            for filename, output in outputs.items():
+                write_json_end(output, empty=total_entries[filename] == 0)
+    except BaseException:
+        # Keep the previous merged files rather than leaving partial ones
+        for temp_path in temp_paths.values():
+            temp_path.unlink(missing_ok=True)
+        raise
+
+    for filename, temp_path in temp_paths.items():
+        os.replace(temp_path, output_dir / filename)
+
+    return total_entries
+
+
+def ensure_ordered_entry(entry: dict, meta: dict) -> dict:
     """Ensure entry structure with proper order and defaults."""
     definitions = [
         ensure_ordered_definition(d, meta) for d in entry.get("definitions", [])
     ]
 
-    data = OrderedDict(
-        [
-            ("word", entry.get("word")),
-            ("definitions", definitions),
-        ]
-    )
+    data = {
+        "word": entry.get("word"),
+        "definitions": definitions,
+    }
 
     return filter_empty_fields(data)
 
 
-def ensure_ordered_definition(definition: dict, meta: OrderedDict) -> OrderedDict:
+def ensure_ordered_definition(definition: dict, meta: dict) -> dict:
     """Ensure definition structure with proper order and defaults."""
-    data = OrderedDict(
-        [
-            ("description", definition.get("description")),
-            ("pos", definition.get("pos")),
-            ("origin", definition.get("origin")),
-            ("usage_note", definition.get("usage_note")),
-            ("synonyms", definition.get("synonyms", [])),
-            ("antonyms", definition.get("antonyms", [])),
-            ("inflections", definition.get("inflections", [])),
-            ("examples", definition.get("examples", [])),
-            ("source_title", definition.get("source_title", meta["source_title"])),
-            ("source_link", definition.get("source_link", meta.get("source_link"))),
-        ]
-    )
+    data = {
+        "description": definition.get("description"),
+        "pos": definition.get("pos"),
+        "origin": definition.get("origin"),
+        "usage_note": definition.get("usage_note"),
+        "synonyms": definition.get("synonyms", []),
+        "antonyms": definition.get("antonyms", []),
+        "inflections": definition.get("inflections", []),
+        "examples": definition.get("examples", []),
+        "source_title": definition.get("source_title", meta["source_title"]),
+        "source_link": definition.get("source_link", meta.get("source_link")),
+    }
 
     return filter_empty_fields(data)
 
 
-def filter_empty_fields(data: OrderedDict) -> OrderedDict:
+def filter_empty_fields(data: dict) -> dict:
     """Remove keys with None, empty lists, or empty strings while keeping order."""
-    return OrderedDict((k, v) for k, v in data.items() if v not in [None, "", []])
+    return {k: v for k, v in data.items() if v not in (None, "", [])}
 
 
 if __name__ == "__main__":
@@ -1,17 +1,21 @@
 import argparse
 import concurrent.futures
-import json
+import orjson
+import os
 import string
 from pathlib import Path
-from bs4 import BeautifulSoup
 from html import unescape
 from itertools import repeat
+from lxml import etree
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
+from wikadata.utils.output_file import open_output_file
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
-STARTING_LETTERS = set(string.ascii_lowercase)
+STARTING_LETTERS = tuple(string.ascii_lowercase)
+ENTRY_TAGS = {"ent", "pos", "def", "ety", "syn", "ant", "source", "q", "qex"}
+CHUNK_SIZE = 64 * 1024
 
 
 def main():
@@ -44,7 +48,11 @@ def main():
 
 def parse(parsed_data: list[dict], dir_path: Path) -> bool:
     """Parses dictionary entries."""
-    with concurrent.futures.ProcessPoolExecutor() as executor:
+    # No more workers than letter files, which are handed out one at a time
+    # since their sizes vary widely
+    max_workers = min(len(STARTING_LETTERS), os.cpu_count() or 1)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
         results = executor.map(process_letter, STARTING_LETTERS, repeat(dir_path))
         for result in results:
             parsed_data.extend(result)
@@ -55,89 +63,153 @@ def parse(parsed_data: list[dict], dir_path: Path) -> bool:
 def process_letter(letter: str, dir_path: Path) -> list[dict]:
     """Processes dictionary entries that start with a specified letter."""
     file_path = dir_path / f"gcide_{letter}.xml"
+    data: list[dict] = []
+
+    parser = etree.HTMLParser(target=GcideHandler(data), recover=True, encoding="utf-8")
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with file_path.open("rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                parser.feed(chunk)
+        parser.close()
     except Exception as e:
         logger.error(f"Error reading file {file_path}: {e}")
-        return []
 
-    soup = BeautifulSoup(content, "lxml")
-    entries = soup.find_all("p")
-    data = []
+    return data
+
 
-    for entry in entries:
-        if new_entry := process_entry(entry):
-            # New word
-            if new_entry.get("word"):
-                data.append(new_entry)
-            # Previous word: if word not present and there's a previous word, append definitions.
-            elif data:
-                data[-1]["definitions"].extend(new_entry["definitions"])
+class GcideHandler:
+    """Parser target that collects dictionary entries as the file is streamed.
 
-    return data
+    Only the text of the tags in ENTRY_TAGS is kept, so no element tree is built.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        self.current_entry: dict[str, list[list[str]]] | None = None
+        self.open_tags: list[tuple[str, list[str]]] = []
+        self.text: list[str] = []
+
+    def start(self, tag: str, attrib: dict) -> None:
+        self.flush_text()
+        if tag == "p":
+            self.current_entry = {}
+        elif self.current_entry is not None and tag in ENTRY_TAGS:
+            fragments: list[str] = []
+            self.current_entry.setdefault(tag, []).append(fragments)
+            self.open_tags.append((tag, fragments))
+
+    def end(self, tag: str) -> None:
+        self.flush_text()
+        if tag == "p" and self.current_entry is not None:
+            self.add_entry(process_entry(self.current_entry))
+            self.current_entry = None
+            self.open_tags = []
+        elif self.open_tags and self.open_tags[-1][0] == tag:
+            self.open_tags.pop()
+
+    def data(self, text: str) -> None:
+        if self.open_tags:
+            self.text.append(text)
+
+    def comment(self, text: str) -> None:
+        self.flush_text()
+
+    def close(self) -> list[dict]:
+        return self.entries
 
+    def flush_text(self) -> None:
+        """Adds the pending text node to every tag it is nested in."""
+        if self.text:
+            text = "".join(self.text)
+            for _, fragments in self.open_tags:
+                fragments.append(text)
+            self.text = []
 
-def process_entry(entry: BeautifulSoup) -> dict | None:
+    def add_entry(self, new_entry: dict | None) -> None:
+        """Adds a processed entry, merging it into the previous word if needed."""
+        if not new_entry:
+            return
+        # New word
+        if new_entry.get("word"):
+            self.entries.append(new_entry)
+        # Previous word: if word not present and there's a previous word, append definitions.
+        elif self.entries:
+            self.entries[-1]["definitions"].extend(new_entry["definitions"])
+
+
+def process_entry(entry: dict[str, list[list[str]]]) -> dict | None:
     """Processes a dictionary entry."""
     try:
         word = None
-        if word_xml := entry.find("ent"):
-            word = word_xml.get_text(strip=True)
+        if (word_xml := find(entry, "ent")) is not None:
+            word = get_text(word_xml, strip=True)
             logger.info(f"Processing entry: {word}")
 
-        pos_xml = entry.find("pos")
-        descriptions_xml = entry.find_all("def")
-        origin_xml = entry.find("ety")
-        synonyms_xml = entry.find("syn")
-        antonyms_xml = entry.find("ant")
-        sources_xml = entry.find_all("source")
-        example_xml = entry.find("q") if entry.find("qex") else None
+        pos_xml = find(entry, "pos")
+        descriptions_xml = entry.get("def", [])
+        origin_xml = find(entry, "ety")
+        synonyms_xml = find(entry, "syn")
+        antonyms_xml = find(entry, "ant")
+        sources_xml = entry.get("source", [])
+        example_xml = find(entry, "q") if "qex" in entry else None
 
-        pos = pos_xml.get_text(strip=True) if pos_xml else None
+        pos = get_text(pos_xml, strip=True) if pos_xml is not None else None
         descriptions = (
-            [unescape(d.get_text(strip=True)) for d in descriptions_xml]
+            [unescape(get_text(d, strip=True)) for d in descriptions_xml]
             if descriptions_xml
             else []
         )
-        origin = unescape(origin_xml.get_text().strip(" []")) if origin_xml else None
+        origin = (
+            unescape(get_text(origin_xml).strip(" []"))
+            if origin_xml is not None
+            else None
+        )
         synonyms = (
             [
                 word.strip().lower()
-                for word in synonyms_xml.get_text(strip=True)
+                for word in get_text(synonyms_xml, strip=True)
                 .replace("Syn. --", "")
                 .split(",")
             ]
-            if synonyms_xml
+            if synonyms_xml is not None
             else []
         )
         antonyms = (
             [
                 word.strip().lower()
-                for word in antonyms_xml.get_text(strip=True).split(";")
+                for word in get_text(antonyms_xml, strip=True).split(";")
             ]
-            if antonyms_xml
+            if antonyms_xml is not None
             else []
         )
-        source = sources_xml[0].get_text(strip=True) if sources_xml else ""
-        examples = [unescape(example_xml.get_text(strip=True))] if example_xml else []
-
-        definitions = []
-        for description in descriptions:
-            definitions.append(
-                {
-                    key: value
-                    for key, value in {
-                        "description": description,
-                        "pos": pos,
-                        "origin": origin,
-                        "synonyms": synonyms,
-                        "antonyms": antonyms,
-                        "examples": examples,
-                        "source_title": source,
-                    }.items()
-                    if value
-                }
+        source = get_text(sources_xml[0], strip=True) if sources_xml else ""
+        examples = (
+            [unescape(get_text(example_xml, strip=True))]
+            if example_xml is not None
+            else []
+        )
+
+        # Fields shared by every definition of the entry
+        shared_fields = {
+            key: value
+            for key, value in {
+                "pos": pos,
+                "origin": origin,
+                "synonyms": synonyms,
+                "antonyms": antonyms,
+                "examples": examples,
+                "source_title": source,
+            }.items()
+            if value
+        }
+        definitions = [
+            (
+                {"description": description, **shared_fields}
+                if description
+                else shared_fields.copy()
             )
+            for description in descriptions
+        ]
 
         return {"word": word, "definitions": definitions}
 
@@ -146,6 +218,19 @@ def process_entry(entry: BeautifulSoup) -> dict | None:
         return None
 
 
+def find(entry: dict[str, list[list[str]]], tag: str) -> list[str] | None:
+    """Gets the text fragments of the first occurrence of a tag in an entry."""
+    occurrences = entry.get(tag)
+    return occurrences[0] if occurrences else None
+
+
+def get_text(fragments: list[str], strip: bool = False) -> str:
+    """Joins the text fragments of a tag."""
+    if strip:
+        return "".join(text.strip() for text in fragments)
+    return "".join(fragments)
+
+
 def export_parsed_data(parsed_data: list[dict], overwrite: bool = False) -> bool:
     """Exports parsed data to a JSON file."""
     if not parsed_data:
@@ -157,14 +242,6 @@ def export_parsed_data(parsed_data: list[dict], overwrite: bool = False) -> bool
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"dictionary_eng_eng_{len(parsed_data)}.json"
 
-    if not overwrite:
-        counter = 2
-        base = output_path.stem
-        ext = output_path.suffix
-        while output_path.exists():
-            output_path = output_dir / f"{base}_{counter}{ext}"
-            counter += 1
-
     json_data = {
         "meta": {
             "lang": "eng",
@@ -177,8 +254,9 @@ def export_parsed_data(parsed_data: list[dict], overwrite: bool = False) -> bool
     }
 
     try:
-        with output_path.open("w", encoding="utf-8") as file:
-            json.dump(json_data, file, indent=2, ensure_ascii=False)
+        output_file, output_path = open_output_file(output_path, overwrite)
+        with output_file:
+            output_file.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
         logger.info(f"Data successfully exported to:\n{output_path}")
         return True
     except IOError as e:
@@ -1,14 +1,23 @@
 import argparse
-import json
+import concurrent.futures
+import orjson
 import re
 import sys
-from bs4 import BeautifulSoup
+from html import unescape
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
+from wikadata.utils.output_file import open_output_file
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+TAG_RE = re.compile(r"<[^>]+>")
+PARENTHESES_RE = re.compile(r"\(.+?\)")
+INFLECTIONS_RE = re.compile(r"^\(([^\(\)]*(?:\(.+?\))?[^\(\)]*)\)")
+POS_RE = re.compile(r"^((?:(?:\d\. )?[a-z]+\.,?;? ?)+)")
+NUMBERING_RE = re.compile(r"\d+(?:\.|\))\s*")
+HEADWORD_JUNK_RE = re.compile(r"[^\w\s-].*$")
+CHUNK_SIZE = 2000
 
 
 def main():
@@ -27,7 +36,7 @@ def main():
     input_paths = (
         input_files
         if input_files
-        else [path for path in (SCRIPT_DIR / "scraped_data").glob("*.json")]
+        else list((SCRIPT_DIR / "scraped_data").glob("*.json"))
     )
 
     for input_path in input_paths:
@@ -56,14 +65,24 @@ def parse(raw_data: list[dict], parsed_data: list[dict]) -> bool:
         logger.error("No data to process.")
         return False
 
-    for entry in raw_data:
-        if processed_entry := process_entry(entry):
-            parsed_data.append(processed_entry)
+    chunks = (raw_data[i : i + CHUNK_SIZE] for i in range(0, len(raw_data), CHUNK_SIZE))
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for result in executor.map(process_chunk, chunks):
+            parsed_data.extend(result)
 
     logger.info(f"Parsing completed. Total entries collected: {len(parsed_data)}")
     return True
 
 
+def process_chunk(entries: list[dict]) -> list[dict]:
+    """Processes a chunk of dictionary entries."""
+    return [
+        processed_entry
+        for entry in entries
+        if (processed_entry := process_entry(entry))
+    ]
+
+
 def process_entry(entry: dict[str, str]) -> dict | None:
     """Processes a dictionary entry."""
     try:
@@ -71,16 +90,14 @@ def process_entry(entry: dict[str, str]) -> dict | None:
         if not word:
             return None
 
-        full_definition = BeautifulSoup(
-            entry.get("definition", ""), "html.parser"
-        ).get_text(strip=True)
+        full_definition = unescape(TAG_RE.sub("", entry.get("definition", ""))).strip()
         source = entry.get("source", "")
 
         logger.info(f"Processing entry: {word}")
 
         # Remove texts in parentheses in word
         # Example: https://tagalog.pinoydictionary.com/word/abay-mga/
-        word = re.sub(r"\(.+?\)", "", word).strip()
+        word = PARENTHESES_RE.sub("", word).strip()
 
         # Remove repeated words separated by a comma
         # Example: https://tagalog.pinoydictionary.com/word/adisyon-adisyon/
@@ -89,14 +106,26 @@ def process_entry(entry: dict[str, str]) -> dict | None:
 
         # Remove word that is prefixed in the definition
         # Example: https://tagalog.pinoydictionary.com/word/aalug-alog/
-        full_definition = re.sub(f"^{word}", "", full_definition).lstrip(" .,;:!?")
+        if full_definition.startswith(word):
+            full_definition = full_definition[len(word) :]
+        else:
+            # Fall back to the word without trailing junk, such as an unmatched "|" or "[...)",
+            # as long as it is a whole word in the definition
+            # Example: https://tagalog.pinoydictionary.com/word/naawas-ang/
+            headword = HEADWORD_JUNK_RE.sub("", word).strip()
+            rest = full_definition[len(headword) :]
+            if (
+                headword
+                and full_definition.startswith(headword)
+                and not rest[:1].isalnum()
+            ):
+                full_definition = rest
+        full_definition = full_definition.lstrip(" .,;:!?")
 
         # Extract inflections (at the start of the definition and enclosed within parentheses)
         # Example: https://tagalog.pinoydictionary.com/word/abain/
         inflections = []
-        if inflection_match := re.match(
-            r"^\(([^\(\)]*(?:\(.+?\))?[^\(\)]*)\)", full_definition
-        ):
+        if inflection_match := INFLECTIONS_RE.match(full_definition):
             inflections_str = inflection_match.group(1).replace(".", ",").strip()
             inflections = [inf.strip() for inf in inflections_str.split(",")]
 
@@ -106,7 +135,7 @@ def process_entry(entry: dict[str, str]) -> dict | None:
         # Extract parts of speech (at the start of the definition with a pattern of <pos>., <pos>.; <pos>.)
         # Example: https://tagalog.pinoydictionary.com/word/abahin/
         pos = None
-        if pos_match := re.match(r"^((?:(?:\d\. )?[a-z]+\.,?;? ?)+)", full_definition):
+        if pos_match := POS_RE.match(full_definition):
             pos = pos_match.group(1).strip()
             full_definition = full_definition[len(pos) :].strip()
 
@@ -124,7 +153,7 @@ def process_entry(entry: dict[str, str]) -> dict | None:
                     }.items()
                     if value  # Include only non-empty values
                 }
-                for description in re.split(r"\d+(?:\.|\))\s*", full_definition)
+                for description in NUMBERING_RE.split(full_definition)
                 if description  # Ensure the description is non-empty
             ]
             if full_definition
@@ -149,7 +178,7 @@ def import_raw_data(file_path: Path) -> tuple[list[dict], dict]:
         return [], {}
 
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = orjson.loads(file_path.read_bytes())
         meta = data.get("meta", {})
         entries = data.get("entries", [])
         logger.info(f"Successfully loaded {len(entries)} entries from {file_path}")
@@ -173,14 +202,6 @@ def export_parsed_data(
     output_filename = f"dictionary_{meta.get('lang', 'unknown')}_{meta.get('definition_lang', 'unknown')}_{meta.get('total_entries', 'unknown')}_{meta.get('date', 'unknown')}_parsed.json"
     output_path = output_dir / output_filename
 
-    if not overwrite:
-        counter = 2
-        while output_path.exists():
-            output_path = (
-                output_dir / f"{output_path.stem}_{counter}{output_path.suffix}"
-            )
-            counter += 1
-
     json_data = {
         "meta": {
             "lang": meta.get("lang", ""),
@@ -192,9 +213,9 @@ def export_parsed_data(
     }
 
     try:
-        output_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        output_file, output_path = open_output_file(output_path, overwrite)
+        with output_file:
+            output_file.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
         logger.info(f"Data successfully exported to: {output_path}")
         return True
     except Exception as e:
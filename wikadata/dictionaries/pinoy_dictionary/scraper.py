@@ -1,11 +1,14 @@
 import argparse
 import bs4
-import json
+import concurrent.futures
+import orjson
+import threading
 from datetime import datetime
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
-from wikadata.utils.fetch_page import fetch_page
+from wikadata.utils.output_file import open_output_file
+from wikadata.utils.fetch_page import MAX_WORKERS, fetch_page
 
 
 SUPPORTED_LANGS = {
@@ -48,55 +51,76 @@ def main():
 
 def scrape(lang: str, scraped_data: list[dict]) -> bool:
     """Scrapes dictionary entries."""
-    for letter in STARTING_LETTERS:
-        page_number = 1
-        while True:
-            logger.info(
-                f"Scraping: {lang.upper()} - Letter: {letter.upper()} - Page {page_number}"
-            )
+    stop = threading.Event()
+    results: dict[str, list[dict]] = {}
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    futures = {
+        executor.submit(scrape_letter, lang, letter, stop): letter
+        for letter in STARTING_LETTERS
+    }
+    try:
+        # Collect letters as they finish so an interruption keeps them
+        for future in concurrent.futures.as_completed(futures):
+            letter = futures[future]
+            results[letter] = future.result()
+            scraped_data.extend(results[letter])
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Restore alphabetical order
+    scraped_data[:] = [
+        entry for letter in STARTING_LETTERS for entry in results.get(letter, [])
+    ]
 
-            # Construct URL
-            base_url = f"https://{SUPPORTED_LANGS[lang].lower()}.pinoydictionary.com/list/{letter}/"
-            url = f"{base_url}{page_number}/" if page_number > 1 else base_url
+    logger.info(f"Scraping completed. Total entries collected: {len(scraped_data)}")
+    return True
 
-            response = fetch_page(url)
 
-            if not response:
-                break
+def scrape_letter(lang: str, letter: str, stop: threading.Event) -> list[dict]:
+    """Scrapes dictionary entries that start with a specified letter."""
+    data = []
+    page_number = 1
+    while not stop.is_set():
+        logger.info(
+            f"Scraping: {lang.upper()} - Letter: {letter.upper()} - Page {page_number}"
+        )
 
-            soup = bs4.BeautifulSoup(response, "html.parser")
-            entries: bs4.ResultSet[bs4.element.Tag] = soup.find_all(class_="word-group")
-            if not entries:
-                logger.info(
-                    f"No entries found on page {page_number}. Moving to next letter."
-                )
-                break
+        # Construct URL
+        base_url = f"https://{SUPPORTED_LANGS[lang].lower()}.pinoydictionary.com/list/{letter}/"
+        url = f"{base_url}{page_number}/" if page_number > 1 else base_url
 
-            for entry in entries:
-                if processed_entry := process_entry(entry):
-                    scraped_data.append(processed_entry)
+        response = fetch_page(url)
 
-            page_number += 1
+        if not response:
+            break
 
-    logger.info(f"Scraping completed. Total entries collected: {len(scraped_data)}")
-    return True
+        soup = bs4.BeautifulSoup(response, "lxml")
+        entries: bs4.ResultSet[bs4.element.Tag] = soup.select(".word-group")
+        if not entries:
+            logger.info(
+                f"No entries found on page {page_number}. Moving to next letter."
+            )
+            break
+
+        for entry in entries:
+            if processed_entry := process_entry(entry):
+                data.append(processed_entry)
+
+        page_number += 1
+
+    return data
 
 
 def process_entry(entry: bs4.element.Tag) -> dict | None:
     """Processes a dictionary entry."""
     try:
-        word_container = entry.find(class_="word")
-        word_entry = (
-            word_container.find(class_="word-entry") if word_container else None
-        )
-        word_element = word_entry.find("a") if word_entry else None
+        word_element = entry.select_one(".word .word-entry a")
         if word_element is None:
             return None
 
-        definition_container = entry.find(class_="definition")
-        definition_element = (
-            definition_container.find("p") if definition_container else None
-        )
+        definition_element = entry.select_one(".definition p")
         if definition_element is None:
             return None
 
@@ -136,14 +160,6 @@ def export_scraped_data(
     )
     output_path = output_dir / output_filename
 
-    if not overwrite:
-        counter = 2
-        while output_path.exists():
-            output_path = (
-                output_dir / f"{output_path.stem}_{counter}{output_path.suffix}"
-            )
-            counter += 1
-
     meta = {
         "lang": lang,
         "definition_lang": DEFINITION_LANG,
@@ -158,9 +174,9 @@ def export_scraped_data(
     }
 
     try:
-        output_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        output_file, output_path = open_output_file(output_path, overwrite)
+        with output_file:
+            output_file.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
         logger.info(f"Data successfully exported to: {output_path}")
         return True
     except IOError as e:
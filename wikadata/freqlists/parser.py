@@ -1,18 +1,20 @@
 import csv
-import sys
+import pickle
+import polars as pl
+from collections import Counter
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
 
-csv.field_size_limit(sys.maxsize)
-
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+LEIPZIG_DIR = SCRIPT_DIR / "raw_data" / "leipzig"
+CACHE_DIR = SCRIPT_DIR / "cache"
 
 
 def main():
     wordlists_dir = SCRIPT_DIR.parent / "wordlists" / "processed_data"
-    freqlists: dict[str, dict[str, int]] = {}
+    freqlists: dict[str, Counter[str]] = {}
 
     on_exit(
         lambda: export_freqlists(freqlists),
@@ -23,10 +25,9 @@ def main():
     export_freqlists(freqlists)
 
 
-def generate_freqlists(
-    wordlists_dir: Path, freqlists: dict[str, dict[str, int]]
-) -> bool:
+def generate_freqlists(wordlists_dir: Path, freqlists: dict[str, Counter[str]]) -> bool:
     """Generate frequency lists from parsed word lists and existing frequency lists."""
+    wordlist_files: dict[str, list[Path]] = {}
     for file_path in wordlists_dir.glob("*.txt"):
         # Assumes filename format: <prefix>_<lang>.txt
         try:
@@ -37,51 +38,121 @@ def generate_freqlists(
             )
             continue
 
-        logger.info(f"Processing '{lang}' word list: {file_path}")
+        wordlist_files.setdefault(lang, []).append(file_path)
+
+    for lang, file_paths in wordlist_files.items():
+        cache_key = get_cache_key(lang, file_paths)
+
+        cached_freqlist = load_cached_freqlist(lang, cache_key)
+        if cached_freqlist is not None:
+            logger.info(f"Inputs unchanged. Using cached '{lang}' frequency list.")
+            freqlists[lang] = cached_freqlist
+            continue
+
+        freqlists[lang] = Counter()
+
+        for file_path in file_paths:
+            logger.info(f"Processing '{lang}' word list: {file_path}")
 
-        freqlists.setdefault(lang, {})
+            # Count the whole file in one pass over its lowercased lines
+            lines = file_path.read_text(encoding="utf-8").lower().split("\n")
+            freqlists[lang].update(filter(None, map(str.strip, lines)))
 
-        with file_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                if word := line.strip().lower():
-                    freqlists[lang][word] = freqlists[lang].get(word, 0) + 1
+            apply_existing_freqlist(freqlists, lang)
 
-        apply_existing_freqlist(freqlists, lang)
+        save_cached_freqlist(lang, cache_key, freqlists[lang])
 
     logger.info(f"Generated {len(freqlists)} frequency lists.")
     return True
 
 
-def apply_existing_freqlist(freqlists: dict[str, dict[str, int]], lang: str) -> bool:
-    """Apply existing frequency list data from the Leipzig corpus."""
-    dir = SCRIPT_DIR / "raw_data" / "leipzig"
+def get_cache_key(lang: str, file_paths: list[Path]) -> tuple:
+    """Identify the inputs of a frequency list by their paths, mtimes and sizes."""
+    source_file = find_existing_freqlist(lang)
+    if source_file is not None:
+        file_paths = [*file_paths, source_file]
+
+    cache_key = []
+    for path in file_paths:
+        stat = path.stat()
+        cache_key.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(cache_key)
+
+
+def load_cached_freqlist(lang: str, cache_key: tuple) -> Counter[str] | None:
+    """Load a cached frequency list if it was generated from the same inputs."""
+    cache_path = CACHE_DIR / f"freqlist_{lang}.pkl"
+    try:
+        with cache_path.open("rb") as cache_file:
+            cached_key, freqlist = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    return freqlist if cached_key == cache_key else None
+
+
+def save_cached_freqlist(lang: str, cache_key: tuple, freqlist: Counter[str]) -> bool:
+    """Cache a frequency list along with the inputs it was generated from."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_path = CACHE_DIR / f"freqlist_{lang}.pkl"
+    try:
+        with cache_path.open("wb") as cache_file:
+            pickle.dump((cache_key, freqlist), cache_file, pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.error(f"Failed to cache '{lang}' frequency list: {e}")
+        return False
+    return True
+
 
-    source_file = next(dir.glob(f"{lang}_*"), None)
+def apply_existing_freqlist(freqlists: dict[str, Counter[str]], lang: str) -> bool:
+    """Apply existing frequency list data from the Leipzig corpus."""
+    source_file = find_existing_freqlist(lang)
     if source_file is None:
         logger.warning(f"No frequency list source file found for {lang}.")
         return False
 
     logger.info(f"Applying existing '{lang}' frequency list: {source_file}.")
 
-    with source_file.open("r", encoding="utf-8") as file:
-        reader = csv.reader(file, delimiter="\t")
-        for row in reader:
-            if len(row) < 2:
-                continue
-
-            word = row[1].lower()
-            try:
-                freq = int(row[-1])
-            except ValueError:
-                continue
+    try:
+        source = pl.read_csv(
+            source_file,
+            separator="\t",
+            has_header=False,
+            quote_char=None,
+            infer_schema_length=0,
+            truncate_ragged_lines=True,
+        )
+    except pl.exceptions.PolarsError as e:
+        logger.error(f"Failed to read frequency list source file: {e}")
+        return False
 
-            if word in freqlists[lang]:
-                freqlists[lang][word] = freqlists[lang].get(word, 0) + freq
+    if source.width < 2:
+        return True
+
+    freqlist = freqlists[lang]
+    # Sum the frequencies of the rows whose word is in the word list
+    frequencies = (
+        source.select(
+            pl.col(source.columns[1]).str.to_lowercase().alias("word"),
+            pl.col(source.columns[-1]).cast(pl.Int64, strict=False).alias("freq"),
+        )
+        .drop_nulls()
+        .filter(pl.col("word").is_in(list(freqlist)))
+        .group_by("word")
+        .agg(pl.col("freq").sum())
+    )
+    for word, freq in frequencies.iter_rows():
+        freqlist[word] += freq
 
     return True
 
 
-def export_freqlists(freqlists: dict[str, dict[str, int]]) -> bool:
+def find_existing_freqlist(lang: str) -> Path | None:
+    """Find the Leipzig corpus frequency list source file of a language."""
+    return next(LEIPZIG_DIR.glob(f"{lang}_*"), None)
+
+
+def export_freqlists(freqlists: dict[str, Counter[str]]) -> bool:
     """Export frequency lists to CSV files."""
     if not freqlists:
         logger.warning("No word lists to export.")
@@ -94,9 +165,7 @@ def export_freqlists(freqlists: dict[str, dict[str, int]]) -> bool:
         output_path = output_dir / f"freqlist_{lang}.csv"
         with output_path.open("w", newline="") as output_file:
             writer = csv.writer(output_file)
-            sorted_words = sorted(words.items(), key=lambda item: item[1], reverse=True)
-            for word, freq in sorted_words:
-                writer.writerow([word, freq])
+            writer.writerows(words.most_common())
 
     logger.info(f"Frequency lists exported to {output_dir}.")
     return True
@@ -1,10 +1,14 @@
-from pathlib import Path
+import concurrent.futures
+import os
 import shutil
+from collections.abc import Iterator
+from pathlib import Path
 from wikadata.utils.logger import logger
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = SCRIPT_DIR.resolve().parent / Path("release")
+MAX_WORKERS = 8
 
 DATA_SOURCES = {
     "dictionaries": Path("wikadata/dictionaries"),
@@ -22,22 +26,39 @@ def main():
 
 def collect_files():
     """Copy parsed files from all modules into the release directory."""
-    for category, base_path in DATA_SOURCES.items():
-        output_path = OUTPUT_DIR / category
-        output_path.mkdir(parents=True, exist_ok=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        for category, base_path in DATA_SOURCES.items():
+            output_path = OUTPUT_DIR / category
+            output_path.mkdir(parents=True, exist_ok=True)
 
-        search_paths = base_path.glob("processed_data")
-
-        for search_path in search_paths:
-            if not search_path.exists():
+            search_path = base_path / "processed_data"
+            if not search_path.is_dir():
                 continue
 
-            for file in search_path.rglob("*"):
-                if not file.is_file():
-                    continue
+            for file in iter_files(search_path):
+                futures.append(executor.submit(copy_file, file, output_path))
+
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+
+def iter_files(dir_path: Path) -> Iterator[os.DirEntry]:
+    """Yield all files under a directory, recursively."""
+    stack = [str(dir_path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
 
-                shutil.copy(file, output_path)
-                logger.info(f"Collected {file} to {output_path}")
+def copy_file(file: os.DirEntry, output_path: Path):
+    """Copy a file into a directory."""
+    shutil.copyfile(file.path, output_path / file.name)
+    logger.info(f"Collected {file.path} to {output_path}")
 
 
 def clean_release():
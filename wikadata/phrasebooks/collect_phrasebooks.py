@@ -1,5 +1,5 @@
-import json
-from collections import defaultdict, OrderedDict
+import orjson
+from collections import defaultdict
 from pathlib import Path
 from wikadata.utils.logger import logger
 
@@ -16,33 +16,29 @@ def main():
 
     for filename, data in merged_phrasebooks.items():
         filepath = OUTPUT_DIR / filename
-        with filepath.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Saved merged phrasebook: {filename}")
 
     logger.info("Phrasebooks generated successfully.")
 
 
-def collect_phrasebooks() -> dict[str, OrderedDict]:
+def collect_phrasebooks() -> dict[str, dict]:
     """Aggregate phrasebook data from all parsed sources."""
-    merged_data = defaultdict(lambda: {"meta": OrderedDict(), "entries": []})
+    merged_data = defaultdict(lambda: {"meta": {}, "entries": []})
 
     for file in PARSED_DIRS:
-        with file.open(encoding="utf-8") as f:
-            data = json.load(f, object_pairs_hook=OrderedDict)
-            meta = data["meta"]
-            entries = data["entries"]
+        data = orjson.loads(file.read_bytes())
+        meta = data["meta"]
+        entries = data["entries"]
 
         filename = f"phrasebook_{meta['lang']}_{meta['translation_lang']}.json"
 
-        merged_data[filename]["meta"] = OrderedDict(
-            [
-                ("lang", meta["lang"]),
-                ("translation_lang", meta["translation_lang"]),
-            ]
-        )
+        merged_data[filename]["meta"] = {
+            "lang": meta["lang"],
+            "translation_lang": meta["translation_lang"],
+        }
         merged_data[filename]["entries"].extend(
-            ensure_ordered_entry(entry, meta) for entry in entries
+            [ensure_ordered_entry(entry, meta) for entry in entries]
         )
 
         logger.info(f"Merged {file} into {filename}")
@@ -50,41 +46,37 @@ def collect_phrasebooks() -> dict[str, OrderedDict]:
     return merged_data
 
 
-def ensure_ordered_entry(entry: dict, meta: OrderedDict) -> OrderedDict:
+def ensure_ordered_entry(entry: dict, meta: dict) -> dict:
     """Ensure entry structure with proper order and defaults."""
     translations = [
         ensure_ordered_translation(t, meta) for t in entry.get("translations")
     ]
 
-    data = OrderedDict(
-        [
-            ("phrase", entry.get("phrase")),
-            ("categories", entry.get("categories")),
-            ("usage_note", entry.get("usage_note")),
-            ("translations", translations),
-        ]
-    )
+    data = {
+        "phrase": entry.get("phrase"),
+        "categories": entry.get("categories"),
+        "usage_note": entry.get("usage_note"),
+        "translations": translations,
+    }
 
-    return OrderedDict(filter_empty_fields(data))
+    return filter_empty_fields(data)
 
 
-def ensure_ordered_translation(translation: dict, meta: OrderedDict) -> OrderedDict:
+def ensure_ordered_translation(translation: dict, meta: dict) -> dict:
     """Ensure translation structure with proper order and defaults."""
-    data = OrderedDict(
-        [
-            ("content", translation.get("content")),
-            ("examples", translation.get("examples")),
-            ("source_title", translation.get("source_title", meta.get("source_title"))),
-            ("source_link", translation.get("source_link", meta.get("source_link"))),
-        ]
-    )
+    data = {
+        "content": translation.get("content"),
+        "examples": translation.get("examples"),
+        "source_title": translation.get("source_title", meta.get("source_title")),
+        "source_link": translation.get("source_link", meta.get("source_link")),
+    }
 
     return filter_empty_fields(data)
 
 
-def filter_empty_fields(data: OrderedDict) -> OrderedDict:
+def filter_empty_fields(data: dict) -> dict:
     """Remove keys with None, empty lists, or empty strings while keeping order."""
-    return OrderedDict((k, v) for k, v in data.items() if v not in [None, "", []])
+    return {k: v for k, v in data.items() if v not in (None, "", [])}
 
 
 if __name__ == "__main__":
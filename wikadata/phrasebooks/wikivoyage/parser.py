@@ -1,13 +1,19 @@
 import argparse
-import json
+import concurrent.futures
+import orjson
 import sys
-from bs4 import BeautifulSoup
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
+from wikadata.utils.json_stream import write_json
+from wikadata.utils.output_file import open_output_file
+from wikadata.utils.strip_html import strip_html
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+CHUNK_SIZE = 256
+# Below this many entries, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 10_000
 
 
 def main():
@@ -26,7 +32,7 @@ def main():
     input_paths = (
         input_files
         if input_files
-        else [path for path in (SCRIPT_DIR / "scraped_data").glob("*.json")]
+        else list((SCRIPT_DIR / "scraped_data").glob("*.json"))
     )
 
     for input_path in input_paths:
@@ -55,9 +61,12 @@ def parse(raw_data: list[dict], parsed_data: list[dict]) -> bool:
         logger.error("No data to process.")
         return False
 
-    for entry in raw_data:
-        if processed_entry := process_entry(entry):
-            parsed_data.append(processed_entry)
+    if len(raw_data) < PARALLEL_THRESHOLD:
+        parsed_data.extend(filter(None, map(process_entry, raw_data)))
+    else:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            results = executor.map(process_entry, raw_data, chunksize=CHUNK_SIZE)
+            parsed_data.extend(filter(None, results))
 
     logger.info(f"Parsing completed. Total entries collected: {len(parsed_data)}")
     return True
@@ -65,43 +74,44 @@ def parse(raw_data: list[dict], parsed_data: list[dict]) -> bool:
 
 def process_entry(entry: dict[str, str]) -> dict | None:
     """Processes a phrasebook entry."""
+    raw_phrase = entry.get("phrase", "")
+    raw_translation = entry.get("translation", "")
+    raw_category = entry.get("category", "")
+    source = entry.get("source", "")
+
     try:
-        phrase = BeautifulSoup(entry.get("phrase", ""), "html.parser").get_text(
-            strip=True
-        )
+        phrase = get_text(raw_phrase)
         if not phrase:
             return None
 
-        full_translation = BeautifulSoup(
-            entry.get("translation", ""), "html.parser"
-        ).get_text(strip=True)
-        category = entry.get("category", "").lower()
-        source = entry.get("source", "")
+        full_translation = get_text(raw_translation)
+        category = raw_category.lower()
 
         logger.info(f"Processing entry: {phrase}")
 
-        translations = (
-            [{"content": full_translation.strip()}] if full_translation else []
-        )
+        # Build the entry directly, leaving out empty fields
+        processed_entry: dict = {"phrase": phrase}
+        if category:
+            processed_entry["categories"] = [category]
+        if source:
+            processed_entry["source_link"] = source
+        if full_translation:
+            processed_entry["translations"] = [{"content": full_translation}]
 
-        return {
-            key: value
-            for key, value in {
-                "phrase": phrase,
-                "categories": [category] if category else [],
-                "source_link": source,
-                "translations": translations,
-            }.items()
-            if value
-        }
+        return processed_entry
 
     except Exception as e:
         logger.error(
-            f"Error processing entry for phrase '{entry.get('phrase', 'Unknown')}': {e}"
+            f"Error processing entry for phrase '{raw_phrase or 'Unknown'}': {e}"
         )
         return None
 
 
+def get_text(value: str) -> str:
+    """Gets the text of a scraped value, which older scrapes stored as HTML."""
+    return strip_html(value) if value.startswith("<") else value.strip()
+
+
 def import_raw_data(file_path: Path) -> tuple[list[dict], dict]:
     """Loads data from a file."""
     logger.info(f"Loading data from {file_path}...")
@@ -111,7 +121,7 @@ def import_raw_data(file_path: Path) -> tuple[list[dict], dict]:
         return [], {}
 
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = orjson.loads(file_path.read_bytes())
         meta = data.get("meta", {})
         entries = data.get("entries", [])
         logger.info(f"Successfully loaded {len(entries)} entries from {file_path}")
@@ -135,28 +145,17 @@ def export_parsed_data(
     output_filename = f"phrases_{meta.get('lang', 'unknown')}_{meta.get('translation_lang', 'unknown')}_{meta.get('total_entries', 'unknown')}_{meta.get('date', 'unknown')}_parsed.json"
     output_path = output_dir / output_filename
 
-    if not overwrite:
-        counter = 2
-        while output_path.exists():
-            output_path = (
-                output_dir / f"{output_path.stem}_{counter}{output_path.suffix}"
-            )
-            counter += 1
-
-    json_data = {
-        "meta": {
-            "lang": meta.get("lang", ""),
-            "translation_lang": meta.get("translation_lang", ""),
-            "source_title": meta.get("source_title", ""),
-            "source_link": meta.get("source_link", ""),
-        },
-        "entries": parsed_data,
+    output_meta = {
+        "lang": meta.get("lang", ""),
+        "translation_lang": meta.get("translation_lang", ""),
+        "source_title": meta.get("source_title", ""),
+        "source_link": meta.get("source_link", ""),
     }
 
     try:
-        output_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        output_file, output_path = open_output_file(output_path, overwrite)
+        with output_file:
+            write_json(output_file, output_meta, parsed_data)
         logger.info(f"Data successfully exported to {output_path}")
         return True
     except Exception as e:
@@ -1,11 +1,13 @@
 import argparse
 import bs4
-import json
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.fetch_page import fetch_page
 from wikadata.utils.graceful_exit import on_exit
+from wikadata.utils.json_stream import write_json
+from wikadata.utils.output_file import open_output_file
 
 
 SUPPORTED_LANGS = {
@@ -57,7 +59,7 @@ def scrape(lang: str, scraped_data: list) -> bool:
         print(f"Failed to fetch {url}")
         return False
 
-    soup = bs4.BeautifulSoup(response, "html.parser")
+    soup = bs4.BeautifulSoup(response, "lxml")
 
     # Find the phrase list section
     phrase_list_section = soup.find("h2", {"id": "Phrase_list"}).find_parent("section")
@@ -77,21 +79,21 @@ def scrape(lang: str, scraped_data: list) -> bool:
 
         logger.info(f"Processing section: {category}")
 
+        # Every entry in a section links to the same section anchor
+        source = f"{url}#{category.capitalize().replace(' ', '_')}"
+
         # Extract terms and translations from data list (dl) tags
         data_lists: list[bs4.element.Tag] = section.find_all("dl", recursive=False)
         for dl in data_lists:
-            dts: list[bs4.element.Tag] = dl.find_all("dt")
-            dds: list[bs4.element.Tag] = dl.find_all("dd")
-
-            for dt, dd in zip(dts, dds):
-                phrase = str(dt)
-                translation = str(dd)
+            for dt, dd in pair_terms(dl):
+                phrase = dt.get_text(strip=True)
+                translation = dd.get_text(strip=True)
 
                 entry = {
                     "phrase": phrase,
                     "translation": translation,
                     "category": category,
-                    "source": f"{url}#{category.capitalize().replace(' ', '_')}",
+                    "source": source,
                 }
 
                 scraped_data.append(entry)
@@ -99,6 +101,22 @@ def scrape(lang: str, scraped_data: list) -> bool:
     return True
 
 
+def pair_terms(
+    dl: bs4.element.Tag,
+) -> Iterator[tuple[bs4.element.Tag, bs4.element.Tag]]:
+    """Pairs each term (dt) of a data list with the description (dd) after it."""
+    dt = None
+    for child in dl.children:
+        if not isinstance(child, bs4.element.Tag):
+            continue
+
+        if child.name == "dt":
+            dt = child
+        elif child.name == "dd" and dt is not None:
+            yield dt, child
+            dt = None
+
+
 def export_scraped_data(lang: str, scraped_data: list, overwrite: bool = False):
     """Exports scraped data to a JSON file."""
     if not scraped_data:
@@ -115,14 +133,6 @@ def export_scraped_data(lang: str, scraped_data: list, overwrite: bool = False):
     )
     output_path = output_dir / output_filename
 
-    if not overwrite:
-        counter = 2
-        while output_path.exists():
-            output_path = (
-                output_dir / f"{output_path.stem}_{counter}{output_path.suffix}"
-            )
-            counter += 1
-
     meta = {
         "lang": SOURCE_LANG,
         "translation_lang": lang,
@@ -131,15 +141,10 @@ def export_scraped_data(lang: str, scraped_data: list, overwrite: bool = False):
         "source_title": f"{SUPPORTED_LANGS[lang]} Wikivoyage Phrasebook",
         "source_link": f"https://en.wikivoyage.org/wiki/{SUPPORTED_LANGS[lang].capitalize()}_phrasebook",
     }
-    json_data = {
-        "meta": meta,
-        "entries": scraped_data,
-    }
-
     try:
-        output_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        output_file, output_path = open_output_file(output_path, overwrite)
+        with output_file:
+            write_json(output_file, meta, scraped_data)
         logger.info(f"Data successfully exported to: {output_path}")
     except IOError as e:
         logger.error(f"Failed to export data: {e}")
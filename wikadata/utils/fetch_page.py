@@ -1,10 +1,18 @@
+import concurrent.futures
 import requests
-from time import sleep
+from functools import cache
+from itertools import repeat
+from requests.adapters import HTTPAdapter
 from typing import Any
+from urllib3.util import Retry
 from wikadata.utils.logger import logger
 from wikadata.utils.user_agents import get_random_user_agent
 
 
+MAX_WORKERS = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
 def fetch_page(url: str, retries=0) -> bytes | Any:
     """Fetches a webpage with retries in case of failure, returning the page content."""
     if retries < 0:
@@ -12,16 +20,38 @@ def fetch_page(url: str, retries=0) -> bytes | Any:
 
     headers = {"User-Agent": get_random_user_agent()}
 
-    attempt = 0
-    while attempt <= retries:
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt+1} failed: {e}")
-            attempt += 1
-            sleep(2 * (attempt + 1))
-
-    logger.error(f"Failed to fetch {url} after {retries} attempts.")
-    return None
+    try:
+        response = get_session(retries).get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        return response.content
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to fetch {url} after {retries} retries: {e}")
+        return None
+
+
+def fetch_pages(urls: list[str], retries=0) -> list[bytes | Any]:
+    """Fetches webpages concurrently, returning their contents in the given order."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(fetch_page, urls, repeat(retries)))
+
+
+@cache
+def get_session(retries: int) -> requests.Session:
+    """Returns a shared session that reuses connections and retries with backoff."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=2,
+        status_forcelist=RETRY_STATUSES,
+    )
+    # Keep one open connection per fetching thread so none has to reconnect
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=retry,
+        pool_block=True,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -3,10 +3,20 @@ import sys
 from wikadata.utils.logger import logger
 
 
+EXIT_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
 def on_exit(callback, message="Process interrupted. Exiting..."):
-    """Handles interruption."""
+    """Handles interruption and termination."""
+    exiting = False
 
     def handle_signal(*_):
+        nonlocal exiting
+        # Let the first signal finish saving instead of starting over
+        if exiting:
+            return
+        exiting = True
+
         logger.info(message)
         try:
             callback()
@@ -15,4 +25,5 @@ def on_exit(callback, message="Process interrupted. Exiting..."):
         finally:
             sys.exit(0)
 
-    signal.signal(signal.SIGINT, handle_signal)
+    for signum in EXIT_SIGNALS:
+        signal.signal(signum, handle_signal)
@@ -0,0 +1,35 @@
+import orjson
+from collections.abc import Iterable
+from typing import BinaryIO
+
+
+def write_json(file: BinaryIO, meta: dict, entries: Iterable[dict]) -> None:
+    """Writes the meta and entries to a JSON file one entry at a time."""
+    write_json_start(file, meta)
+    first = True
+    for entry in entries:
+        write_json_entry(file, entry, first=first)
+        first = False
+    write_json_end(file, empty=first)
+
+
+def write_json_start(file: BinaryIO, meta: dict) -> None:
+    """Writes the meta and the opening of the entries list of a JSON file."""
+    file.write(b'{\n  "meta": ' + dumps_indented(meta, 2) + b',\n  "entries": [')
+
+
+def write_json_entry(file: BinaryIO, entry: dict, first: bool = False) -> None:
+    """Writes an entry to the entries list of a JSON file."""
+    file.write((b"\n    " if first else b",\n    ") + dumps_indented(entry, 4))
+
+
+def write_json_end(file: BinaryIO, empty: bool = False) -> None:
+    """Closes the entries list and the object of a JSON file."""
+    file.write(b"]\n}" if empty else b"\n  ]\n}")
+
+
+def dumps_indented(data: dict, level: int) -> bytes:
+    """Serializes data with two-space indentation, nested at the given level."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).replace(
+        b"\n", b"\n" + b" " * level
+    )
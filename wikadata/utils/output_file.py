@@ -0,0 +1,22 @@
+import os
+import time
+from pathlib import Path
+from typing import BinaryIO
+
+
+def open_output_file(
+    output_path: Path, overwrite: bool = False
+) -> tuple[BinaryIO, Path]:
+    """Opens a file for writing, adding a unique suffix if it already exists."""
+    if overwrite:
+        return output_path.open("wb"), output_path
+
+    # Check and create in a single call instead of probing for a free name
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(output_path, flags, 0o644)
+    except FileExistsError:
+        output_path = output_path.with_stem(f"{output_path.stem}_{time.time_ns()}")
+        fd = os.open(output_path, flags, 0o644)
+
+    return os.fdopen(fd, "wb"), output_path
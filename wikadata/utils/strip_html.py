@@ -0,0 +1,12 @@
+import re
+from functools import lru_cache
+from html import unescape
+
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+@lru_cache(maxsize=8192)
+def strip_html(html: str) -> str:
+    """Extracts the text of an HTML fragment, stripping each text node."""
+    return "".join(unescape(text).strip() for text in TAG_RE.split(html))
@@ -1,11 +1,16 @@
-import json
+import concurrent.futures
+import orjson
+import os
 import unicodedata
+from collections.abc import Iterator
 from pathlib import Path
 from wikadata.utils.logger import logger
 from wikadata.utils.graceful_exit import on_exit
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+# Unit separator, used to strip many words at once
+WORD_SEPARATOR = "\x1f"
 
 
 def main():
@@ -23,23 +28,43 @@ def main():
 
 def generate_wordlists(dictionaries_dir: Path, wordlists: dict[str, set[str]]) -> bool:
     """Generates word lists from parsed dictionaries."""
-    for file_path in dictionaries_dir.glob("*/parsed/*.json"):
-        logger.info(f"Processing file: {file_path}")
+    file_paths = list(iter_parsed_files(dictionaries_dir))
 
-        with file_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-            lang = data["meta"]["lang"]
-
-            wordlists.setdefault(lang, set())
-
-            for entry in data["entries"]:
-                normalized_word = strip_diacritics(entry["word"])
-                wordlists[lang].add(normalized_word)
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        results = executor.map(process_dictionary_file, file_paths, chunksize=4)
+        for lang, words in results:
+            wordlists.setdefault(lang, set()).update(words)
 
     logger.info(f"Generated {len(wordlists)} word lists.")
     return True
 
 
+def iter_parsed_files(dictionaries_dir: Path) -> Iterator[Path]:
+    """Yields the JSON files in the parsed directory of each dictionary source."""
+    with os.scandir(dictionaries_dir) as sources:
+        for source in sources:
+            parsed_dir = os.path.join(source.path, "parsed")
+            if not source.is_dir() or not os.path.isdir(parsed_dir):
+                continue
+
+            with os.scandir(parsed_dir) as files:
+                for file in files:
+                    if file.name.endswith(".json") and file.is_file():
+                        yield Path(file.path)
+
+
+def process_dictionary_file(file_path: Path) -> tuple[str, set[str]]:
+    """Collects the normalized words of a parsed dictionary file."""
+    logger.info(f"Processing file: {file_path}")
+
+    data = orjson.loads(file_path.read_bytes())
+    lang = data["meta"]["lang"]
+
+    words = normalize_words([entry["word"] for entry in data["entries"]])
+
+    return lang, words
+
+
 def export_wordlists(wordlists: dict[str, set[str]]) -> bool:
     """Exports word lists to JSON files."""
     if not wordlists:
@@ -51,18 +76,41 @@ def export_wordlists(wordlists: dict[str, set[str]]) -> bool:
 
     for lang, words in wordlists.items():
         output_path = output_dir / f"wordlist_{lang}.txt"
-        with output_path.open("w", encoding="utf-8") as file:
-            sorted_words = sorted(words)
-            file.writelines("\n".join(sorted_words))
+        output_path.write_bytes(("\n".join(sorted(words)) + "\n").encode("utf-8"))
 
     logger.info(f"Word lists successfully exported to {output_dir}.")
     return True
 
 
+def normalize_words(words: list[str]) -> set[str]:
+    """Strips diacritics from many words, joining them into one string to do so."""
+    # ASCII words have no diacritics to strip
+    normalized_words = {word for word in words if word.isascii()}
+    other_words = [word for word in words if not word.isascii()]
+
+    if any(WORD_SEPARATOR in word for word in other_words):
+        normalized_words.update(map(strip_diacritics, other_words))
+    elif other_words:
+        joined_words = WORD_SEPARATOR.join(other_words)
+        normalized_words.update(strip_diacritics(joined_words).split(WORD_SEPARATOR))
+
+    return normalized_words
+
+
 def strip_diacritics(text: str) -> str:
-    return "".join(
-        c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn"
-    )
+    return unicodedata.normalize("NFD", text).translate(DIACRITICS_TABLE)
+
+
+class DiacriticsTable(dict):
+    """Translation table that deletes combining marks, filled in as they are seen."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        is_mark = unicodedata.category(chr(codepoint)) == "Mn"
+        self[codepoint] = None if is_mark else codepoint
+        return self[codepoint]
+
+
+DIACRITICS_TABLE = DiacriticsTable()
 
 
 if __name__ == "__main__":